@@ -1,52 +1,111 @@
 #!/usr/bin/env python3
+import asyncio
+import atexit
+import concurrent.futures
+import ctypes
+import ctypes.util
+import struct
 import subprocess
 import os
-import time
 import signal
-import sys
+import time
+
+try:
+    import pynvml
+except ImportError:
+    pynvml = None
+
+# Optional C reader built by `make -C sysfs_fast` (pread + strtol, no bytecode per poll)
+try:
+    from _sysfs_fast import read_millic
+except ImportError:
+    read_millic = None
+
+
+def _env_int(name, default):
+    try:
+        return int(os.environ[name])
+    except (KeyError, ValueError):
+        return default
+
 
-# Configuration
-CPU_THRESHOLD = 85
-GPU_THRESHOLD = 75
-CPU_HYSTERESIS = 80
-GPU_HYSTERESIS = 70
-CHECK_INTERVAL = 2  # Seconds
+# Configuration (overridable from the systemd unit, e.g. Environment=AUTO_TURBO_CPU_THRESHOLD=90)
+CPU_THRESHOLD = _env_int("AUTO_TURBO_CPU_THRESHOLD", 85)
+GPU_THRESHOLD = _env_int("AUTO_TURBO_GPU_THRESHOLD", 75)
+CPU_HYSTERESIS = _env_int("AUTO_TURBO_CPU_HYSTERESIS", 80)
+GPU_HYSTERESIS = _env_int("AUTO_TURBO_GPU_HYSTERESIS", 70)
+CHECK_INTERVAL = _env_int("AUTO_TURBO_CHECK_INTERVAL", 2)  # Seconds
 
 # Paths
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+# systemd runs us with an absolute path, so this avoids abspath()'s getcwd() call
+BASE_DIR = (
+    os.path.dirname(__file__)
+    if os.path.isabs(__file__)
+    else os.path.normpath(os.path.join(os.getcwd(), os.path.dirname(__file__)))
+)
 SCRIPT_PATH = os.path.join(BASE_DIR, "tdp-manager.sh")
 DESIRED_PROFILE_FILE = "/tmp/tdp_desired_profile"
+# Written by the GUI when it installs auto-turbo.service (USER_HOME=/home/USERNAME)
+ENV_FILE = "/etc/tdp-manager/env"
+# nvidia-smi fallback queries (used only when NVML is unavailable)
+NVIDIA_SMI_TEMP_ARGS = (
+    "nvidia-smi",
+    "--query-gpu=temperature.gpu",
+    "--format=csv,noheader,nounits",
+)
+NVIDIA_SMI_POWER_ARGS = ("nvidia-smi", "-q", "-d", "POWER")
+
+# inotify (no stdlib binding, so call libc directly)
+_libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_IGNORED = 0x00008000
+INOTIFY_EVENT = struct.Struct("iIII")  # wd, mask, cookie, len (+ name)
+
+# /run is a tmpfs, so the cached zone never outlives a boot (zone numbering may change)
+CPU_ZONE_CACHE = "/run/tdp-manager/cpu_zone"
+# While the CPU sensor is missing or failing, rescan the zones at most this often
+CPU_ZONE_RETRY_INTERVAL = 30  # Seconds
 
 
 class AutoTurboDaemon:
     def __init__(self):
         self.in_auto_turbo = False
         self.running = True
-        self.cpu_thermal_path = self._find_cpu_thermal_path()
+        self.cpu_thermal_path = self._load_cpu_thermal_path()
+        self._cpu_fd = self._open_cpu_thermal_fd()
+        self._cpu_rescan_at = 0  # monotonic time of the next allowed zone rescan
+        atexit.register(self.close)
+        self.gpu_handle = self._init_nvml()
+        # The nvidia-smi fallback can block for up to 1s; run it on a worker so it
+        # overlaps the sysfs CPU read. NVML calls are in-process and need no thread.
+        self.pool = (
+            concurrent.futures.ThreadPoolExecutor(max_workers=1)
+            if self.gpu_handle is None
+            else None
+        )
+        # Long-lived tdp-manager.sh command server, started on first use (see run_manager)
+        self.mgr = None
 
         # Initialize desired profile if not exists
         if not os.path.exists(DESIRED_PROFILE_FILE):
             # Try to load from persistent storage
-            # We need to find the real user home. Since we run as root, we look at the script path.
-            # Script is in /home/USERNAME/repo/...
-            parts = BASE_DIR.split("/")
-            user_home = "/" + os.path.join(*parts[:3]) if len(parts) > 2 else "/root"
-            
             persistent_file = os.path.join(
-                user_home, ".config", "tdp-manager", "last_profile"
+                self._read_user_home(), ".config", "tdp-manager", "last_profile"
             )
 
             start_profile = "balanced"
-            if os.path.exists(persistent_file):
-                try:
-                    with open(persistent_file, "r") as f:
-                        start_profile = f.read().strip()
-                    print(
-                        f"Startup: Loaded persistent profile '{start_profile}' from {persistent_file}",
-                        flush=True,
-                    )
-                except Exception as e:
-                    print(f"Startup: Error loading persistent profile: {e}", flush=True)
+            try:
+                with open(persistent_file, "r") as f:
+                    start_profile = f.read().strip()
+                print(
+                    f"Startup: Loaded persistent profile '{start_profile}' from {persistent_file}",
+                    flush=True,
+                )
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                print(f"Startup: Error loading persistent profile: {e}", flush=True)
 
             # If user left it on Turbo/Extreme, downgrade to Balanced for startup silence
             # The daemon will auto-engage Turbo if temps get high anyway.
@@ -59,28 +118,232 @@ class AutoTurboDaemon:
 
             self.set_desired_profile(start_profile)
 
-    def _find_cpu_thermal_path(self):
+        # Watch the desired-profile file so it is only re-read when the GUI writes it
+        self._inotify_fd = None
+        self._profile_wd = None
+        self.desired_profile = "balanced"
+        self._profile_mtime = None
+        self._init_profile_watch()
+
+    def _read_user_home(self):
+        # We run as root, so the real user home comes from the installer's env file
         try:
-            for i in range(10):
-                path = f"/sys/class/thermal/thermal_zone{i}/temp"
-                if os.path.exists(path):
-                    type_path = f"/sys/class/thermal/thermal_zone{i}/type"
-                    if os.path.exists(type_path):
-                        with open(type_path, "r") as f:
-                            ztype = f.read().strip()
-                        if "x86_pkg" in ztype or "cpu" in ztype.lower():
-                            return path
+            with open(ENV_FILE, "r") as f:
+                for line in f:
+                    key, _, value = line.partition("=")
+                    if key.strip() == "USER_HOME" and value.strip():
+                        return value.strip()
+        except OSError:
+            pass
+
+        # Older installs: derive it from the script location (/home/USERNAME/repo/...)
+        parts = BASE_DIR.split("/", 3)
+        return "/".join(parts[:3]) if len(parts) > 2 else "/root"
+
+    def _load_cpu_thermal_path(self):
+        # Reuse the zone discovered by a previous daemon run during this boot
+        try:
+            with open(CPU_ZONE_CACHE, "r") as f:
+                path = f.read().strip()
+            if os.path.exists(path):
+                return path
         except:
             pass
+
+        return self._discover_cpu_thermal_path()
+
+    def _discover_cpu_thermal_path(self):
+        path = self._find_cpu_thermal_path()
+        if path:
+            try:
+                os.makedirs(os.path.dirname(CPU_ZONE_CACHE), exist_ok=True)
+                with open(CPU_ZONE_CACHE, "w") as f:
+                    f.write(path)
+            except Exception as e:
+                print(f"Warning: Could not cache thermal zone path: {e}", flush=True)
+        return path
+
+    def _rediscover_cpu_thermal(self):
+        # The zone may appear late (thermal driver loaded after us), vanish, or be
+        # renumbered; the cached path can also be stale. Rescan, rate-limited.
+        now = time.monotonic()
+        if now < self._cpu_rescan_at:
+            return
+        self._cpu_rescan_at = now + CPU_ZONE_RETRY_INTERVAL
+        if self._cpu_fd is not None:
+            try:
+                os.close(self._cpu_fd)
+            except OSError:
+                pass
+            self._cpu_fd = None
+        self.cpu_thermal_path = self._discover_cpu_thermal_path()
+        self._cpu_fd = self._open_cpu_thermal_fd()
+        if self._cpu_fd is not None:
+            print(f"CPU thermal zone: {self.cpu_thermal_path}", flush=True)
+
+    def _open_cpu_thermal_fd(self):
+        # Kept open for the daemon lifetime: sysfs re-evaluates the value on every
+        # read from offset 0, so each poll is lseek+read instead of open+read+close.
+        if not self.cpu_thermal_path:
+            return None
+        try:
+            return os.open(self.cpu_thermal_path, os.O_RDONLY)
+        except OSError as e:
+            print(f"Error opening {self.cpu_thermal_path}: {e}", flush=True)
+            return None
+
+    async def _start_manager(self):
+        try:
+            return await asyncio.create_subprocess_exec(
+                SCRIPT_PATH,
+                "server",
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+        except OSError as e:
+            print(f"Could not start tdp-manager.sh server: {e}", flush=True)
+            return None
+
+    async def _stop_manager(self):
+        mgr, self.mgr = self.mgr, None
+        if mgr is None or mgr.returncode is not None:
+            return
+        try:
+            mgr.stdin.close()  # EOF ends the server loop
+            await asyncio.wait_for(mgr.wait(), timeout=2)
+        except (OSError, asyncio.TimeoutError):
+            mgr.kill()
+            await mgr.wait()
+
+    async def run_manager(self, *args):
+        """Run a tdp-manager.sh command through the persistent server.
+
+        Respawns the server if it exited and falls back to a one-shot
+        invocation if it cannot be used. Returns True on success.
+        """
+        if self.mgr is None or self.mgr.returncode is not None:
+            self.mgr = await self._start_manager()
+        if self.mgr is not None:
+            try:
+                self.mgr.stdin.write((" ".join(args) + "\n").encode())
+                await self.mgr.stdin.drain()
+                reply = await self.mgr.stdout.readline()
+                if reply:
+                    return reply.strip() == b"OK"
+            except OSError:
+                pass
+            await self._stop_manager()
+
+        proc = await asyncio.create_subprocess_exec(
+            SCRIPT_PATH,
+            *args,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        return await proc.wait() == 0
+
+    def close(self):
+        pool, self.pool = getattr(self, "pool", None), None
+        if pool is not None:
+            pool.shutdown(wait=False)
+        for attr in ("_cpu_fd", "_inotify_fd"):
+            fd = getattr(self, attr, None)
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+                setattr(self, attr, None)
+
+    def _find_cpu_thermal_path(self):
+        for i in range(10):
+            try:
+                with open(f"/sys/class/thermal/thermal_zone{i}/type", "r") as f:
+                    ztype = f.read().strip()
+            except OSError:
+                continue
+            if "x86_pkg" in ztype or "cpu" in ztype.lower():
+                return f"/sys/class/thermal/thermal_zone{i}/temp"
         return None
 
-    def get_desired_profile(self):
+    def _init_nvml(self):
+        # NVML is initialized once for the daemon lifetime; repeated init/shutdown is costly.
+        # Returns None (nvidia-smi fallback) on hosts without pynvml or the NVIDIA driver.
+        if pynvml is None:
+            return None
+        try:
+            pynvml.nvmlInit()
+        except pynvml.NVMLError as e:
+            print(f"NVML unavailable, falling back to nvidia-smi: {e}", flush=True)
+            return None
+        atexit.register(pynvml.nvmlShutdown)
+        try:
+            return pynvml.nvmlDeviceGetHandleByIndex(0)
+        except pynvml.NVMLError as e:
+            print(f"NVML: no GPU handle, falling back to nvidia-smi: {e}", flush=True)
+            return None
+
+    def _init_profile_watch(self):
+        fd = _libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            print(f"inotify unavailable ({os.strerror(err)}), polling profile file", flush=True)
+            return
+        self._inotify_fd = fd
+        self._add_profile_watch()
+
+    def _add_profile_watch(self):
+        wd = _libc.inotify_add_watch(
+            self._inotify_fd,
+            os.fsencode(DESIRED_PROFILE_FILE),
+            IN_MODIFY | IN_CLOSE_WRITE,
+        )
+        self._profile_wd = wd if wd >= 0 else None
+        # The file may have changed while it was not being watched
+        self.desired_profile = self._read_desired_profile()
+
+    def _handle_profile_events(self):
+        # Drain the queue; any number of events means "re-read once"
+        while True:
+            try:
+                buf = os.read(self._inotify_fd, 4096)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(buf):
+                wd, mask, _, name_len = INOTIFY_EVENT.unpack_from(buf, offset)
+                if mask & IN_IGNORED and wd == self._profile_wd:
+                    # File was deleted/replaced; the watch is gone
+                    self._profile_wd = None
+                offset += INOTIFY_EVENT.size + name_len
+
+        if self._profile_wd is None:
+            self._add_profile_watch()
+        else:
+            self.desired_profile = self._read_desired_profile()
+
+    def _read_desired_profile(self):
         try:
             with open(DESIRED_PROFILE_FILE, "r") as f:
                 return f.read().strip()
         except:
             return "balanced"
 
+    def get_desired_profile(self):
+        if self._profile_wd is not None:
+            return self.desired_profile
+
+        # No inotify watch: a single stat() tells us whether the cached value is stale
+        try:
+            mtime = os.stat(DESIRED_PROFILE_FILE).st_mtime_ns
+        except OSError:
+            return "balanced"
+        if mtime != self._profile_mtime:
+            self._profile_mtime = mtime
+            self.desired_profile = self._read_desired_profile()
+        return self.desired_profile
+
     def set_desired_profile(self, profile):
         try:
             with open(DESIRED_PROFILE_FILE, "w") as f:
@@ -98,26 +361,35 @@ class AutoTurboDaemon:
             print(f"Error setting profile file: {e}", flush=True)
 
     def get_cpu_temp(self):
-        if not self.cpu_thermal_path:
-            # Try to find it again if lost
-            self.cpu_thermal_path = self._find_cpu_thermal_path()
-            if not self.cpu_thermal_path:
+        if self._cpu_fd is None:
+            self._rediscover_cpu_thermal()
+            if self._cpu_fd is None:
                 return None
-
         try:
-            with open(self.cpu_thermal_path, "r") as f:
-                return int(f.read().strip()) // 1000
-        except:
+            if read_millic is not None:
+                return read_millic(self._cpu_fd)
+            os.lseek(self._cpu_fd, 0, os.SEEK_SET)
+            # int() accepts bytes with the trailing newline: no decode, no strip()
+            return int(os.read(self._cpu_fd, 16)) // 1000
+        except OSError:
+            # ENODEV/ENOENT/EIO/EBADF: the zone went away or changed, find it again
+            self._rediscover_cpu_thermal()
+            return None
+        except ValueError:
             return None
 
     def get_gpu_temp(self):
+        if self.gpu_handle is not None:
+            try:
+                return pynvml.nvmlDeviceGetTemperature(
+                    self.gpu_handle, pynvml.NVML_TEMPERATURE_GPU
+                )
+            except pynvml.NVMLError:
+                return None
+
         try:
             res = subprocess.run(
-                [
-                    "nvidia-smi",
-                    "--query-gpu=temperature.gpu",
-                    "--format=csv,noheader,nounits",
-                ],
+                NVIDIA_SMI_TEMP_ARGS,
                 capture_output=True,
                 text=True,
                 timeout=1,
@@ -132,22 +404,29 @@ class AutoTurboDaemon:
         try:
             with open(
                 "/sys/class/powercap/intel-rapl/intel-rapl:0/constraint_0_power_limit_uw",
-                "r",
+                "rb",
             ) as f:
-                pl1 = int(f.read().strip()) // 1000000
+                pl1 = int(f.read()) // 1000000
             with open(
                 "/sys/class/powercap/intel-rapl/intel-rapl:0/constraint_1_power_limit_uw",
-                "r",
+                "rb",
             ) as f:
-                pl2 = int(f.read().strip()) // 1000000
+                pl2 = int(f.read()) // 1000000
             return pl1, pl2
         except:
             return 80, 115
 
     def get_current_gpu_limit(self):
+        if self.gpu_handle is not None:
+            try:
+                # NVML reports milliwatts
+                return pynvml.nvmlDeviceGetPowerManagementLimit(self.gpu_handle) // 1000
+            except pynvml.NVMLError:
+                return None
+
         try:
             res = subprocess.run(
-                ["nvidia-smi", "-q", "-d", "POWER"],
+                NVIDIA_SMI_POWER_ARGS,
                 capture_output=True,
                 text=True,
                 timeout=1,
@@ -164,7 +443,27 @@ class AutoTurboDaemon:
             pass
         return None
 
-    def run(self):
+    async def run(self):
+        # SIGINT/SIGTERM cancel the main task so the cleanup below still runs
+        loop = asyncio.get_running_loop()
+        task = asyncio.current_task()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, task.cancel)
+
+        # The GUI rewriting the desired-profile file wakes the loop via inotify
+        if self._inotify_fd is not None:
+            loop.add_reader(self._inotify_fd, self._handle_profile_events)
+
+        try:
+            await self._run()
+        except asyncio.CancelledError:
+            pass
+        finally:
+            if self._inotify_fd is not None:
+                loop.remove_reader(self._inotify_fd)
+            await self._stop_manager()
+
+    async def _run(self):
         print(
             f"Auto Turbo Daemon started. (CPU >= {CPU_THRESHOLD}°C or GPU >= {GPU_THRESHOLD}°C)",
             flush=True,
@@ -175,93 +474,97 @@ class AutoTurboDaemon:
         try:
             # Wait a few seconds to let kernel modules (acer_thermal_lite) initialize and export sysfs fully
             print("Startup: Waiting 5s for hardware modules to initialize...", flush=True)
-            time.sleep(5)
+            await asyncio.sleep(5)
 
             desired = self.get_desired_profile()
             print(f"Startup: Ensuring current profile is '{desired}'", flush=True)
-            res_profile = subprocess.run([SCRIPT_PATH, "profile", desired], capture_output=True, text=True)
-            if res_profile.returncode != 0:
-                print(f"Startup: Profile error. Out: {res_profile.stdout} Err: {res_profile.stderr}", flush=True)
+            if not await self.run_manager("profile", desired):
+                print("Startup: Profile error.", flush=True)
 
             # Explicitly disable Fan Boost (Max Fans) on startup to ensure silence
             print("Startup: Forcing Fan Boost OFF...", flush=True)
-            res_fan = subprocess.run([SCRIPT_PATH, "fanboost", "0"], capture_output=True, text=True)
-            if res_fan.returncode != 0:
-                print(f"Startup: Fanboost error. Out: {res_fan.stdout} Err: {res_fan.stderr}", flush=True)
+            if not await self.run_manager("fanboost", "0"):
+                print("Startup: Fanboost error.", flush=True)
 
         except Exception as e:
             print(f"Startup reset error: {e}", flush=True)
 
-        print("Startup: Waiting 15s for temperatures to settle...", flush=True)
-        time.sleep(15)
+        # Wait up to 15s for temperatures to settle. A machine that is already
+        # cool and stable is ready after two consecutive close readings.
+        print("Startup: Waiting up to 15s for temperatures to settle...", flush=True)
+        prev = None
+        for elapsed in range(15):
+            temp = self.get_cpu_temp()
+            if (
+                temp is not None
+                and prev is not None
+                and temp < CPU_HYSTERESIS
+                and abs(temp - prev) <= 1
+            ):
+                print(f"Startup: Temperature settled at {temp}°C after {elapsed}s", flush=True)
+                break
+            prev = temp
+            await asyncio.sleep(1)
 
         while self.running:
-            try:
+            if self._inotify_fd is not None and self._profile_wd is None:
+                self._add_profile_watch()
+            await self.check_temperatures()
+            await asyncio.sleep(CHECK_INTERVAL)
+
+    async def check_temperatures(self):
+        loop = asyncio.get_running_loop()
+        try:
+            if self.pool is not None:
+                gpu_future = loop.run_in_executor(self.pool, self.get_gpu_temp)
+                cpu = self.get_cpu_temp()
+                gpu = await gpu_future
+            else:
                 cpu = self.get_cpu_temp()
                 gpu = self.get_gpu_temp()
 
-                # Treat None as 0 (safe fallback, don't trigger turbo on error)
-                cpu_val = cpu if cpu is not None else 0
-                gpu_val = gpu if gpu is not None else 0
+            # Treat None as 0 (safe fallback, don't trigger turbo on error)
+            cpu_val = cpu if cpu is not None else 0
+            gpu_val = gpu if gpu is not None else 0
 
-                if cpu_val >= CPU_THRESHOLD or gpu_val >= GPU_THRESHOLD:
-                    if not self.in_auto_turbo:
-                        pl1, pl2 = self.get_current_limits()
-                        gpu_limit = self.get_current_gpu_limit()
-                        print(
-                            f"TEMP HIGH: CPU:{cpu}°C GPU:{gpu}°C. Activating MAX Fans (Performance mode)...",
-                            flush=True,
-                        )
-                        # 1. Force EC into Turbo (Performance) mode - This will ramp up fans
-                        subprocess.run(
-                            [SCRIPT_PATH, "platform", "performance"],
-                            capture_output=True,
-                        )
-                        # 2. Wait a bit for EC to stabilize
-                        time.sleep(0.5)
-                        # 3. Restore the user power limits immediately (hardware override bypass)
-                        print(
-                            f"Restoring power limits to PL1={pl1}W PL2={pl2}W",
-                            flush=True,
-                        )
-                        subprocess.run(
-                            [SCRIPT_PATH, "set", str(pl1), str(pl2)],
-                            capture_output=True,
+            if cpu_val >= CPU_THRESHOLD or gpu_val >= GPU_THRESHOLD:
+                if not self.in_auto_turbo:
+                    pl1, pl2 = self.get_current_limits()
+                    if self.pool is not None:
+                        gpu_limit = await loop.run_in_executor(
+                            self.pool, self.get_current_gpu_limit
                         )
+                    else:
+                        gpu_limit = self.get_current_gpu_limit()
+                    print(
+                        f"TEMP HIGH: CPU:{cpu}°C GPU:{gpu}°C. Activating MAX Fans (Performance mode)...",
+                        flush=True,
+                    )
+                    # Force EC into Turbo (Performance) mode to ramp up fans, then
+                    # restore the user power limits (hardware override bypass)
+                    print(
+                        f"Restoring power limits to PL1={pl1}W PL2={pl2}W"
+                        + (f" GPU={gpu_limit}W" if gpu_limit else ""),
+                        flush=True,
+                    )
+                    await self.run_manager(
+                        "turbo-apply", str(pl1), str(pl2), str(gpu_limit or 0)
+                    )
 
-                        # 4. Restore GPU limit if we can read it
-                        if gpu_limit:
-                            print(f"Restoring GPU limit to {gpu_limit}W", flush=True)
-                            subprocess.run(
-                                [SCRIPT_PATH, "gpu", str(gpu_limit)],
-                                capture_output=True,
-                            )
-
-                        self.in_auto_turbo = True
-                elif cpu_val < CPU_HYSTERESIS and gpu_val < GPU_HYSTERESIS:
-                    if self.in_auto_turbo:
-                        print(
-                            f"TEMP OK: CPU:{cpu_val}°C GPU:{gpu_val}°C. Restoring original profile settings.",
-                            flush=True,
-                        )
-                        desired = self.get_desired_profile()
-                        subprocess.run(
-                            [SCRIPT_PATH, "profile", desired], capture_output=True
-                        )
-                        self.in_auto_turbo = False
-            except Exception as e:
-                print(f"Error in daemon loop: {e}", flush=True)
-
-            time.sleep(CHECK_INTERVAL)
-
-
-def signal_handler(sig, frame):
-    sys.exit(0)
+                    self.in_auto_turbo = True
+            elif cpu_val < CPU_HYSTERESIS and gpu_val < GPU_HYSTERESIS:
+                if self.in_auto_turbo:
+                    print(
+                        f"TEMP OK: CPU:{cpu_val}°C GPU:{gpu_val}°C. Restoring original profile settings.",
+                        flush=True,
+                    )
+                    desired = self.get_desired_profile()
+                    await self.run_manager("profile", desired)
+                    self.in_auto_turbo = False
+        except Exception as e:
+            print(f"Error in daemon loop: {e}", flush=True)
 
 
 if __name__ == "__main__":
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
-
     daemon = AutoTurboDaemon()
-    daemon.run()
+    asyncio.run(daemon.run())
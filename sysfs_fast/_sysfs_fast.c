@@ -0,0 +1,57 @@
+/*
+ * Optional C helper for auto-turbo-daemon.py: reads a sysfs millidegree
+ * value (e.g. thermal_zoneN/temp) from an open fd with a single pread and
+ * returns whole degrees. The daemon falls back to os.lseek + os.read when
+ * this module is not built.
+ */
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <errno.h>
+#include <stdlib.h>
+#include <unistd.h>
+
+static PyObject *read_millic(PyObject *self, PyObject *args)
+{
+    char buf[16];
+    char *end;
+    ssize_t n;
+    long value;
+    int fd;
+
+    if (!PyArg_ParseTuple(args, "i", &fd))
+        return NULL;
+
+    n = pread(fd, buf, sizeof(buf) - 1, 0);
+    if (n < 0)
+        return PyErr_SetFromErrno(PyExc_OSError);
+    buf[n] = '\0';
+
+    errno = 0;
+    value = strtol(buf, &end, 10);
+    if (end == buf || errno) {
+        PyErr_Format(PyExc_ValueError, "invalid sysfs value: %.15s", buf);
+        return NULL;
+    }
+
+    /* Floor division, matching Python's // for negative readings */
+    return PyLong_FromLong(value / 1000 - (value % 1000 < 0));
+}
+
+static PyMethodDef sysfs_fast_methods[] = {
+    {"read_millic", read_millic, METH_VARARGS,
+     "read_millic(fd) -> int: pread a millidegree sysfs value at offset 0 and return degrees."},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef sysfs_fast_module = {
+    PyModuleDef_HEAD_INIT,
+    "_sysfs_fast",
+    "Fast sysfs readers for the auto turbo daemon.",
+    -1,
+    sysfs_fast_methods,
+};
+
+PyMODINIT_FUNC PyInit__sysfs_fast(void)
+{
+    return PyModule_Create(&sysfs_fast_module);
+}
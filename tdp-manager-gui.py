@@ -6,16 +6,57 @@ Similar to ThrottleStop for Windows.
 """
 
 import gi
-import subprocess
+import atexit
 import os
+import select
 import threading
-import glob
+import time
+from dataclasses import dataclass
+
+try:
+    import pynvml
+except ImportError:
+    pynvml = None
 
 gi.require_version("Gtk", "3.0")
-from gi.repository import Gtk, GLib, Gdk
+from gi.repository import Gtk, GLib, Gdk, Gio
+
+# Paths resolved once at import, not per click
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+TDP_SCRIPT = os.path.join(SCRIPT_DIR, "tdp-manager.sh")
+DAEMON_SCRIPT = os.path.join(SCRIPT_DIR, "auto-turbo-daemon.py")
+
+# Stylesheet: compiled GResource bundle if built (see doc/TECHNICAL_INFO.md),
+# otherwise the plain style.css next to this script
+RESOURCE_FILE = os.path.join(SCRIPT_DIR, "tdp-manager.gresource")
+CSS_FILE = os.path.join(SCRIPT_DIR, "style.css")
+CSS_RESOURCE_PATH = "/org/tdp/style.css"
+# Parsed once per process and added once per screen, however many windows
+_css_provider = None
+_css_screens = set()
 
 # RAPL sysfs paths
 RAPL_PATH = "/sys/class/powercap/intel-rapl/intel-rapl:0"
+FAN_BOOST_PATH = "/sys/devices/platform/acer-thermal-lite/fan_boost"
+
+# Status refresh cadence in seconds. Temperatures have no change
+# notification and must be polled; NVML reads are in-process and run every
+# tick, the nvidia-smi fallback forks and is kept much rarer
+TEMP_POLL_INTERVAL = 1
+GPU_POLL_INTERVAL = 5
+# While the CPU sensor is missing or failing, rescan the zones at most this often
+TEMP_ZONE_RETRY_INTERVAL = 30
+
+# Upper bound for pkexec'd one-shot commands, time at the auth prompt included
+PRIVILEGED_TIMEOUT = 30
+
+# systemd manager over D-Bus (polkit handles authorization)
+SYSTEMD_BUS_NAME = "org.freedesktop.systemd1"
+SYSTEMD_OBJECT_PATH = "/org/freedesktop/systemd1"
+SYSTEMD_MANAGER_IFACE = "org.freedesktop.systemd1.Manager"
+AUTO_TURBO_UNIT = "auto-turbo.service"
+SERVICE_FILE = "/etc/systemd/system/auto-turbo.service"
+ENV_FILE = "/etc/tdp-manager/env"  # Read by auto-turbo-daemon.py
 
 # Power profiles (PL1, PL2 in watts)
 # Synced with tdp-manager.sh
@@ -27,9 +68,69 @@ PROFILES = {
     "turbo": ("🚀 Turbo", 100, 140, 80),
     "extreme": ("🔥 Extreme", 115, 160, 115),
 }
+# (profile_id, button label) in display order
+PROFILE_BUTTON_SPECS = tuple(
+    (profile_id, f"{display} ({pl1}W/{pl2}W/{gpu}W)")
+    for profile_id, (display, pl1, pl2, gpu) in PROFILES.items()
+)
+
+# Keep Applied: limits must read more than KEEP_BAND_W off the held profile
+# for KEEP_DRIFT_TICKS consecutive status reads (one per TEMP_POLL_INTERVAL,
+# changed or not) before they are re-applied
+# (ignores transient dips); holding stops after KEEP_MAX_REAPPLIES re-applies
+# that don't stick, e.g. when firmware clamps a limit
+KEEP_BAND_W = 1
+KEEP_DRIFT_TICKS = 3
+KEEP_MAX_REAPPLIES = 3
+
+# Slider ranges (watts) and their value labels, built once instead of
+# formatted on every value-changed
+PL1_MIN, PL1_MAX = 10, 150
+PL2_MIN, PL2_MAX = 15, 180
+PL1_LABELS = {v: f"{v}W" for v in range(PL1_MIN, PL1_MAX + 1)}
+PL2_LABELS = {v: f"{v}W" for v in range(PL2_MIN, PL2_MAX + 1)}
+
+
+class InstallError(Exception):
+    """Copying the auto-turbo unit or env file into /etc failed."""
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """Hardware state gathered by the status thread in one tick."""
+
+    pl1: int
+    pl2: int
+    cpu_temp: int
+    fan_boost: bool
+    ec_status: str
+    gpu_temp: int
+    gpu_limit: int
+
+
+def _detect_cpu_name():
+    # One read and a bytes find: no per-line iteration or decoding
+    try:
+        with open("/proc/cpuinfo", "rb") as f:
+            data = f.read()
+    except OSError:
+        return "Intel CPU"
+    start = data.find(b"model name")
+    if start < 0:
+        return "Intel CPU"
+    colon = data.find(b":", start)
+    end = data.find(b"\n", colon)
+    if end < 0:
+        end = len(data)
+    return data[colon + 1 : end].strip().decode(errors="replace")
+
+
+# The model name never changes: read /proc/cpuinfo once per process
+_CPU_NAME = _detect_cpu_name()
 
 
 class TDPManagerWindow(Gtk.Window):
+
     def __init__(self):
         super().__init__(title="TDP Manager")
         self.set_default_size(400, 600)
@@ -37,102 +138,53 @@ class TDPManagerWindow(Gtk.Window):
         self.active_profile = None
         self.lock_limits = False
         self.is_applying = False  # Safety lock for auth/subprocess
+        self._last_snapshot = None  # Last Snapshot posted to the UI
+        self._last_temp_class = None
+        self._active_gpu_btn = None
+        self._last_ec_status = None
+        # Keep Applied: profile the user applied with Keep Applied on, the
+        # consecutive drifted updates, and re-applies since limits last held
+        self._keep_profile = None
+        self._drift_ticks = 0
+        self._reapplies = 0
+        # Privileged `tdp-manager.sh server`, started on first apply so only
+        # the first command pays for the pkexec/polkit round trip
+        self._helper = None
+        self._helper_lock = threading.Lock()
+        # Short-lived children started by _run(), killed on destroy
+        self._children = set()
+        self._children_lock = threading.Lock()
+        self._systemd = None  # Gio.DBusProxy for the systemd manager, created on first use
+        self.connect("destroy", self._on_destroy)
+        # Pending slider label refreshes (coalesced to one per frame)
+        self._pl1_pending = None
+        self._pl2_pending = None
+
+        # Files polled every tick are opened once and re-read with pread at
+        # offset 0 (sysfs regenerates the value on each read)
+        self._rapl_fds = [
+            self._open_sysfs(f"{RAPL_PATH}/constraint_{c}_power_limit_uw")
+            for c in (0, 1)
+        ]
+        self._temp_path = self._discover_temp_path()
+        self._temp_fd = self._open_sysfs(self._temp_path)
+        self._temp_rescan_at = 0  # monotonic time of the next allowed zone rescan
+        self._fan_boost_fd = self._open_sysfs(FAN_BOOST_PATH)
+        self._profile_path = self._find_platform_profile()
+        # Set from the main loop when a watched sysfs file changes
+        self._refresh = threading.Event()
+        self._sysfs_monitors = self._init_sysfs_monitors()
+        self._gpu_handle = self._init_nvml()
+        self._gpu_status = (0, 0)  # (temp, limit) last read by the status thread
+        self._next_gpu_read = 0
 
         # Apply dark theme
         settings = Gtk.Settings.get_default()
         settings.set_property("gtk-application-prefer-dark-theme", True)
 
-        # Custom CSS
-        css_provider = Gtk.CssProvider()
-        css_provider.load_from_data(b"""
-            window {
-                background-color: #1a1a2e;
-            }
-            label {
-                color: #eaeaea;
-            }
-            .title-label {
-                font-size: 24px;
-                font-weight: bold;
-                color: #00d9ff;
-            }
-            .subtitle-label {
-                font-size: 12px;
-                color: #888888;
-            }
-            .value-label {
-                font-size: 32px;
-                font-weight: bold;
-                color: #00ff88;
-            }
-            .unit-label {
-                font-size: 14px;
-                color: #888888;
-            }
-            .profile-button {
-                padding: 12px 20px;
-                font-size: 14px;
-                border-radius: 8px;
-                background: linear-gradient(135deg, #2d2d44 0%, #1a1a2e 100%);
-                border: 1px solid #3d3d5c;
-                color: #ffffff;
-            }
-            .profile-button:hover {
-                background: linear-gradient(135deg, #3d3d5c 0%, #2d2d44 100%);
-                border-color: #00d9ff;
-            }
-            .profile-button.active {
-                background: linear-gradient(135deg, #00d9ff 0%, #0099cc 100%);
-                color: #000000;
-            }
-            .apply-button {
-                padding: 15px 30px;
-                font-size: 16px;
-                font-weight: bold;
-                border-radius: 10px;
-                background: linear-gradient(135deg, #00d9ff 0%, #0099cc 100%);
-                border: none;
-                color: #000000;
-            }
-            .apply-button:hover {
-                background: linear-gradient(135deg, #33e0ff 0%, #00b3e6 100%);
-            }
-            scale {
-                min-height: 20px;
-            }
-            scale trough {
-                background-color: #2d2d44;
-                border-radius: 10px;
-                min-height: 10px;
-            }
-            scale highlight {
-                background: linear-gradient(90deg, #00ff88 0%, #00d9ff 100%);
-                border-radius: 10px;
-            }
-            scale slider {
-                background-color: #ffffff;
-                border-radius: 50%;
-                min-width: 20px;
-                min-height: 20px;
-            }
-            .status-box {
-                background-color: #2d2d44;
-                border-radius: 10px;
-                padding: 15px;
-            }
-            .temp-label {
-                font-size: 18px;
-                font-weight: bold;
-            }
-            .temp-ok { color: #00ff88; }
-            .temp-warn { color: #ffaa00; }
-            .temp-crit { color: #ff4444; }
-        """)
-        Gtk.StyleContext.add_provider_for_screen(
-            Gdk.Screen.get_default(),
-            css_provider,
-            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
-        )
+        # Custom CSS: parsed and installed once the main loop is idle, so the
+        # first frame isn't held back by stylesheet loading
+        GLib.idle_add(self._install_css, priority=GLib.PRIORITY_DEFAULT_IDLE)
 
         # Main container
         main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=15)
@@ -218,6 +270,7 @@ class TDPManagerWindow(Gtk.Window):
         self.keep_applied_switch.set_tooltip_text(
             "Automatically re-apply limits if they drop (Anti-Throttle)"
         )
+        self.keep_applied_switch.connect("notify::active", self.on_keep_applied_toggled)
         keep_label = Gtk.Label(label="Keep Applied:")
         keep_label.get_style_context().add_class("subtitle-label")
 
@@ -226,11 +279,14 @@ class TDPManagerWindow(Gtk.Window):
 
         # Auto Turbo (Service Control)
         self.auto_turbo_switch = Gtk.Switch()
-        self.auto_turbo_switch.set_active(self.is_service_active("auto-turbo"))
         self.auto_turbo_switch.set_tooltip_text(
             "Enable Background Auto Turbo Service (CPU 80°C / GPU 70°C)"
         )
-        self.auto_turbo_switch.connect("notify::active", self.on_auto_turbo_toggled)
+        self._auto_turbo_handler = self.auto_turbo_switch.connect(
+            "notify::active", self.on_auto_turbo_toggled
+        )
+        # `systemctl is-active` forks: query it off the main loop
+        self._sync_auto_turbo_switch()
         auto_turbo_label = Gtk.Label(label="Background Auto Turbo:")
         auto_turbo_label.get_style_context().add_class("subtitle-label")
 
@@ -281,13 +337,21 @@ class TDPManagerWindow(Gtk.Window):
         profiles_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
         self.profile_buttons = {}
 
-        for profile_id, (profile_display, pl1, pl2, gpu) in PROFILES.items():
-            btn = Gtk.Button(label=f"{profile_display} ({pl1}W/{pl2}W/{gpu}W)")
+        for profile_id, button_label in PROFILE_BUTTON_SPECS:
+            btn = Gtk.Button(label=button_label)
             btn.get_style_context().add_class("profile-button")
             btn.connect("clicked", self.on_profile_clicked, profile_id)
             profiles_box.pack_start(btn, False, False, 0)
             self.profile_buttons[profile_id] = btn
 
+        # (PL1, PL2) -> (profile_id, button, GPU limit): the per-tick active
+        # profile check is a single dict lookup with everything pre-bound
+        self._profile_rows = {
+            (pl1, pl2): (profile_id, self.profile_buttons[profile_id], gpu)
+            for profile_id, (_, pl1, pl2, gpu) in PROFILES.items()
+        }
+        self._active_profile_btn = None
+
         main_box.pack_start(profiles_box, False, False, 0)
 
         # Custom Power Section
@@ -301,13 +365,15 @@ class TDPManagerWindow(Gtk.Window):
         pl1_slider_label = Gtk.Label(label="PL1:")
         pl1_slider_label.set_width_chars(4)
         self.pl1_slider = Gtk.Scale.new_with_range(
-            Gtk.Orientation.HORIZONTAL, 10, 150, 5
+            Gtk.Orientation.HORIZONTAL, PL1_MIN, PL1_MAX, 5
         )
         self.pl1_slider.set_value(60)
         self.pl1_slider.set_hexpand(True)
         self.pl1_slider_value = Gtk.Label(label="60W")
         self.pl1_slider_value.set_width_chars(5)
-        self.pl1_slider.connect("value-changed", self.on_pl1_changed)
+        self._pl1_handler = self.pl1_slider.connect(
+            "value-changed", self.on_pl1_changed
+        )
         pl1_slider_box.pack_start(pl1_slider_label, False, False, 0)
         pl1_slider_box.pack_start(self.pl1_slider, True, True, 0)
         pl1_slider_box.pack_start(self.pl1_slider_value, False, False, 0)
@@ -318,13 +384,15 @@ class TDPManagerWindow(Gtk.Window):
         pl2_slider_label = Gtk.Label(label="PL2:")
         pl2_slider_label.set_width_chars(4)
         self.pl2_slider = Gtk.Scale.new_with_range(
-            Gtk.Orientation.HORIZONTAL, 15, 180, 5
+            Gtk.Orientation.HORIZONTAL, PL2_MIN, PL2_MAX, 5
         )
         self.pl2_slider.set_value(80)
         self.pl2_slider.set_hexpand(True)
         self.pl2_slider_value = Gtk.Label(label="80W")
         self.pl2_slider_value.set_width_chars(5)
-        self.pl2_slider.connect("value-changed", self.on_pl2_changed)
+        self._pl2_handler = self.pl2_slider.connect(
+            "value-changed", self.on_pl2_changed
+        )
         pl2_slider_box.pack_start(pl2_slider_label, False, False, 0)
         pl2_slider_box.pack_start(self.pl2_slider, True, True, 0)
         pl2_slider_box.pack_start(self.pl2_slider_value, False, False, 0)
@@ -345,38 +413,449 @@ class TDPManagerWindow(Gtk.Window):
         self.status_label.get_style_context().add_class("subtitle-label")
         main_box.pack_end(self.status_label, False, False, 0)
 
-        # Start update timer
-        self.update_status()
-        GLib.timeout_add(1000, self.update_status)
+        # Status polling pauses while the window is minimized or unmapped
+        self._visible = threading.Event()
+        # Set on destroy: the status thread exits before its fds are closed
+        self._stop = threading.Event()
+        self.connect("map", self._on_map)
+        self.connect("unmap", self._on_unmap)
+        self.connect("window-state-event", self._on_window_state)
+
+        # Start status updates: sysfs/nvidia-smi reads happen on a background
+        # thread so a slow driver never stalls the GTK main loop
+        self._status_thread = threading.Thread(target=self._status_worker)
+        self._status_thread.daemon = True
+        self._status_thread.start()
+
+    @staticmethod
+    def _load_css():
+        css_provider = Gtk.CssProvider()
+        try:
+            Gio.Resource.load(RESOURCE_FILE)._register()
+            css_provider.load_from_resource(CSS_RESOURCE_PATH)
+        except GLib.Error:
+            # Bundle not compiled: parse the stylesheet from disk
+            css_provider.load_from_path(CSS_FILE)
+        return css_provider
+
+    def _install_css(self):
+        global _css_provider
+        screen = self.get_screen()
+        if screen not in _css_screens:
+            if _css_provider is None:
+                _css_provider = self._load_css()
+            Gtk.StyleContext.add_provider_for_screen(
+                screen, _css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+            )
+            _css_screens.add(screen)
+        return False  # One-shot idle callback
 
-    def get_cpu_name(self):
+    @staticmethod
+    def _open_sysfs(path):
         try:
-            with open("/proc/cpuinfo", "r") as f:
-                for line in f:
-                    if "model name" in line:
-                        return line.split(":")[1].strip()
-        except Exception:
-            pass
-        return "Intel CPU"
+            return os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+        except OSError:
+            return None
+
+    @staticmethod
+    def _init_nvml():
+        # Returns None (nvidia-smi fallback) without pynvml or the NVIDIA driver
+        if pynvml is None:
+            return None
+        try:
+            pynvml.nvmlInit()
+        except pynvml.NVMLError:
+            return None
+        atexit.register(pynvml.nvmlShutdown)
+        try:
+            return pynvml.nvmlDeviceGetHandleByIndex(0)
+        except pynvml.NVMLError:
+            return None
 
-    def read_rapl_value(self, constraint):
+    @staticmethod
+    def _find_platform_profile():
         try:
-            with open(f"{RAPL_PATH}/constraint_{constraint}_power_limit_uw", "r") as f:
-                return int(f.read().strip()) // 1000000
-        except Exception:
-            return 0
+            entries = sorted(os.listdir("/sys/class/platform-profile"))
+        except OSError:
+            return None
+        for entry in entries:
+            path = f"/sys/class/platform-profile/{entry}/profile"
+            if os.path.exists(path):
+                return path
+        return None
+
+    def _init_sysfs_monitors(self):
+        """Watches the files tdp-manager.sh writes so applies show up at once.
+
+        sysfs only reports changes for writes made through the filesystem,
+        which covers every limit/fan/profile change; temperatures are polled.
+        """
+        monitors = []
+        for path in (
+            f"{RAPL_PATH}/constraint_0_power_limit_uw",
+            f"{RAPL_PATH}/constraint_1_power_limit_uw",
+            FAN_BOOST_PATH,
+            self._profile_path,
+        ):
+            if not path:
+                continue
+            monitor = self._monitor_sysfs(path)
+            if monitor is not None:
+                monitors.append(monitor)  # Monitors stop when garbage collected
+        return monitors
+
+    def _monitor_sysfs(self, path):
+        try:
+            monitor = Gio.File.new_for_path(path).monitor_file(
+                Gio.FileMonitorFlags.NONE, None
+            )
+        except GLib.Error:
+            return None
+        monitor.connect("changed", self._on_sysfs_changed)
+        return monitor
+
+    def _add_sysfs_monitor(self, path):
+        # Main loop side of a path the status thread found after startup
+        monitor = self._monitor_sysfs(path)
+        if monitor is not None:
+            self._sysfs_monitors.append(monitor)
+        return False
+
+    def _on_sysfs_changed(self, monitor, file, other_file, event_type):
+        # Wake the status thread for an immediate re-read
+        self._refresh.set()
+
+    def _wait_for_change(self, timeout):
+        if self._refresh.wait(timeout):
+            self._refresh.clear()
+
+    def _discover_temp_path(self):
+        # x86_pkg_temp (package sensor) wins, then any other CPU zone, then
+        # thermal_zone0
+        try:
+            zones = [
+                name
+                for name in os.listdir("/sys/class/thermal")
+                if name.startswith("thermal_zone")
+            ]
+        except OSError:
+            zones = []
+        # Numeric order (zone10 after zone9), and no cap on the zone count
+        zones.sort(key=lambda name: int(name[len("thermal_zone") :] or 0))
+
+        cpu_zone = None
+        for zone in zones:
+            try:
+                with open(f"/sys/class/thermal/{zone}/type", "r") as f:
+                    zone_type = f.read().strip()
+            except OSError:
+                continue
+            if "x86_pkg" in zone_type:
+                return f"/sys/class/thermal/{zone}/temp"
+            if cpu_zone is None and "cpu" in zone_type.lower():
+                cpu_zone = f"/sys/class/thermal/{zone}/temp"
+        return cpu_zone or "/sys/class/thermal/thermal_zone0/temp"
+
+    def get_cpu_name(self):
+        return _CPU_NAME
+
+    @staticmethod
+    def _pread_int(fd, size):
+        """Returns the integer in a sysfs file, or None if it can't be read."""
+        if fd is None:
+            return None
+        try:
+            # int() accepts the raw bytes, trailing newline included
+            return int(os.pread(fd, size, 0))
+        except (OSError, ValueError):
+            return None
+
+    def read_sysfs(self):
+        """Returns (PL1 W, PL2 W, CPU °C) from the cached sysfs fds.
+
+        The three preads run back to back with no other work in between.
+        """
+        pread = self._pread_int
+        pl1_fd, pl2_fd = self._rapl_fds
+        pl1 = pread(pl1_fd, 24)
+        pl2 = pread(pl2_fd, 24)
+        temp = pread(self._temp_fd, 16)
+        if temp is None:
+            # Sensor missing, or zones renumbered (e.g. thermal driver reload):
+            # rediscover, rate-limited so a dead sensor isn't rescanned per tick
+            now = time.monotonic()
+            if now >= self._temp_rescan_at:
+                self._temp_rescan_at = now + TEMP_ZONE_RETRY_INTERVAL
+                self._reopen_temp()
+                temp = pread(self._temp_fd, 16)
+        return (
+            (pl1 or 0) // 1000000,
+            (pl2 or 0) // 1000000,
+            (temp or 0) // 1000,
+        )
+
+    def _reopen_temp(self):
+        if self._temp_fd is not None:
+            os.close(self._temp_fd)
+            self._temp_fd = None
+        if self._stop.is_set():
+            return
+        self._temp_path = self._discover_temp_path()
+        self._temp_fd = self._open_sysfs(self._temp_path)
+
+    def _sync_auto_turbo_switch(self):
+        shown = self.auto_turbo_switch.get_active()
+
+        def worker():
+            active = self.is_service_active("auto-turbo")
+            GLib.idle_add(self._set_auto_turbo_switch, shown, active)
+
+        thread = threading.Thread(target=worker)
+        thread.daemon = True
+        thread.start()
+
+    def _set_auto_turbo_switch(self, shown, active):
+        # A toggle made while the query ran wins over its result
+        if self.auto_turbo_switch.get_active() == shown:
+            with self.auto_turbo_switch.handler_block(self._auto_turbo_handler):
+                self.auto_turbo_switch.set_active(active)
+        return False  # One-shot idle callback
 
     def is_service_active(self, service_name):
         try:
-            result = subprocess.run(
-                ["systemctl", "is-active", service_name],
-                capture_output=True,
-                text=True,
+            _, stdout, _ = self._run(
+                ["systemctl", "is-active", service_name], timeout=5, capture=True
             )
-            return result.stdout.strip() == "active"
+            return stdout.strip() == "active"
         except Exception:
             return False
 
+    def _run(self, cmd, timeout, capture=False):
+        """subprocess.run() replacement used for every short-lived child.
+
+        Kills the child when the timeout expires and while it's still running
+        at window destroy. Returns (returncode, stdout, stderr); returncode
+        is None if the command timed out.
+        """
+        import subprocess
+
+        pipe = subprocess.PIPE if capture else subprocess.DEVNULL
+        proc = subprocess.Popen(
+            cmd, stdin=subprocess.DEVNULL, stdout=pipe, stderr=pipe, text=True
+        )
+        with self._children_lock:
+            self._children.add(proc)
+        try:
+            stdout, stderr = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            return None, "", f"timed out after {timeout} seconds"
+        finally:
+            with self._children_lock:
+                self._children.discard(proc)
+        return proc.returncode, stdout or "", stderr or ""
+
+    def _on_destroy(self, widget):
+        # Stop the status thread first so it spawns no new children, and wake
+        # it wherever it waits
+        self._stop.set()
+        self._visible.set()
+        self._refresh.set()
+
+        with self._children_lock:
+            children = list(self._children)
+        for proc in children:
+            try:
+                proc.kill()
+            except OSError:
+                pass
+
+        helper, self._helper = self._helper, None
+        if helper is not None and helper.poll() is None:
+            try:
+                helper.stdin.close()  # EOF ends the server loop
+            except OSError:
+                pass
+
+        for monitor in self._sysfs_monitors:
+            monitor.cancel()
+        self._sysfs_monitors = []
+
+        # Let it finish its tick (killing the children unblocks nvidia-smi)
+        self._status_thread.join(timeout=2)
+        if self._status_thread.is_alive():
+            # Stuck in a driver read: leave the fds to process exit
+            return
+
+        fds = self._rapl_fds + [self._temp_fd, self._fan_boost_fd]
+        self._rapl_fds = [None, None]
+        self._temp_fd = self._fan_boost_fd = None
+        for fd in fds:
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+
+    def helper_running(self):
+        helper = self._helper
+        return helper is not None and helper.poll() is None
+
+    def run_helper_command(self, *args, spawn=True):
+        """Runs a tdp-manager.sh command through the privileged helper.
+
+        Called from worker threads. Returns (ok, message): ok is True/False
+        for OK/ERR, or None if the helper couldn't start or exited and the
+        caller should fall back to a one-shot run; message is the error text
+        from an ERR reply or a timeout. A timeout is a failure, not a fallback:
+        retrying would prompt again and re-run a command that may still be
+        running as root.
+        With spawn=False a helper that isn't running is not (re)started, so
+        no pkexec prompt can appear; ok is None instead.
+        """
+        import subprocess
+
+        with self._helper_lock:
+            if self._helper is None or self._helper.poll() is not None:
+                if not spawn:
+                    return None, ""
+                try:
+                    self._helper = subprocess.Popen(
+                        self.get_auth_command() + [TDP_SCRIPT, "server"],
+                        stdin=subprocess.PIPE,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.DEVNULL,
+                    )
+                except OSError:
+                    self._helper = None
+                    return None, ""
+
+            try:
+                self._helper.stdin.write((" ".join(args) + "\n").encode())
+                self._helper.stdin.flush()
+                reply = self._read_helper_reply(self._helper)
+            except OSError:
+                reply = ""
+            if reply is None:
+                # Prompt left open or command hung: drop the helper
+                helper, self._helper = self._helper, None
+                self._abandon_helper(helper)
+                return False, f"timed out after {PRIVILEGED_TIMEOUT} seconds"
+            if reply:
+                # "OK" or "ERR <rc> <message>"
+                parts = reply.strip().split(" ", 2)
+                if parts[0] == "OK":
+                    return True, ""
+                return False, parts[2] if len(parts) > 2 else ""
+
+            helper, self._helper = self._helper, None
+            try:
+                returncode = helper.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                helper.kill()
+                return None, ""
+            # pkexec: 126 = auth dismissed, 127 = not authorized; don't prompt again
+            return (False if returncode in (126, 127) else None), ""
+
+    @staticmethod
+    def _read_helper_reply(helper):
+        """Reads one reply line: None on timeout, "" if the helper exited."""
+        fd = helper.stdout.fileno()
+        deadline = time.monotonic() + PRIVILEGED_TIMEOUT
+        data = b""
+        while not data.endswith(b"\n"):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if not ready:
+                return None
+            chunk = os.read(fd, 256)
+            if not chunk:
+                return ""
+            data += chunk
+        return data.decode(errors="replace")
+
+    @staticmethod
+    def _abandon_helper(helper):
+        # pkexec still waiting for auth is ours to kill; once it has become the
+        # root helper it isn't, and EOF on stdin ends its loop after the command
+        try:
+            helper.kill()
+        except OSError:
+            pass
+        try:
+            helper.stdin.close()
+        except OSError:
+            pass
+
+    def systemd_call(self, method, signature=None, *args):
+        """Calls a systemd Manager method over D-Bus (from a worker thread).
+
+        Replaces a pkexec + systemctl fork per action; polkit prompts through
+        the session agent when the call needs authorization.
+        """
+        if self._systemd is None:
+            self._systemd = Gio.DBusProxy.new_for_bus_sync(
+                Gio.BusType.SYSTEM,
+                Gio.DBusProxyFlags.DO_NOT_LOAD_PROPERTIES
+                | Gio.DBusProxyFlags.DO_NOT_CONNECT_SIGNALS,
+                None,
+                SYSTEMD_BUS_NAME,
+                SYSTEMD_OBJECT_PATH,
+                SYSTEMD_MANAGER_IFACE,
+                None,
+            )
+        params = GLib.Variant(signature, args) if signature else None
+        # Same bound as pkexec commands, time at the polkit dialog included
+        return self._systemd.call_sync(
+            method,
+            params,
+            Gio.DBusCallFlags.ALLOW_INTERACTIVE_AUTHORIZATION,
+            PRIVILEGED_TIMEOUT * 1000,
+            None,
+        )
+
+    def run_privileged(self, on_done, *args):
+        """Runs `tdp-manager.sh <args>` as root without blocking the UI.
+
+        Goes through the persistent helper, falling back to a one-shot
+        pkexec run. on_done(ok, error_msg) is called on the main loop.
+        """
+
+        def worker():
+            error_msg = "Auth cancelled or error"
+            try:
+                ok, message = self.run_helper_command(*args)
+                if ok is False and message:
+                    error_msg = message
+                if ok is None:
+                    # Helper unavailable: one-shot run
+                    returncode, _, stderr = self._run(
+                        self.get_auth_command() + [TDP_SCRIPT, *args],
+                        timeout=PRIVILEGED_TIMEOUT,
+                        capture=True,
+                    )
+                    ok = returncode == 0
+                    if stderr:
+                        error_msg = stderr.strip()
+            except Exception as e:
+                ok, error_msg = False, str(e)
+            GLib.idle_add(on_done, ok, error_msg)
+
+        thread = threading.Thread(target=worker)
+        thread.daemon = True
+        thread.start()
+
+    @staticmethod
+    def _file_matches(path, content):
+        try:
+            with open(path, "r") as f:
+                return f.read() == content
+        except OSError:
+            return False
+
     def get_auth_command(self):
         """Returns ['pkexec'] if not root, else empty list"""
         if os.getuid() == 0:
@@ -388,7 +867,6 @@ class TDPManagerWindow(Gtk.Window):
             return
 
         active = switch.get_active()
-        action = "start" if active else "stop"
         self.is_applying = True
         self.status_label.set_text(
             f"{'Starting' if active else 'Stopping'} background service..."
@@ -396,55 +874,47 @@ class TDPManagerWindow(Gtk.Window):
 
         def run_action():
             try:
+                auth = self.get_auth_command()
                 if active:
                     # Generate a dynamic service file for the current location/user
-                    script_dir = os.path.dirname(os.path.abspath(__file__))
                     service_content = f"""[Unit]
 Description=Predator Auto Turbo Fan Daemon
 After=multi-user.target
 
 [Service]
 Type=simple
-ExecStart=/usr/bin/python3 {os.path.join(script_dir, "auto-turbo-daemon.py")}
+ExecStart=/usr/bin/python3 -O {DAEMON_SCRIPT}
 Restart=always
 RestartSec=5
 
 [Install]
 WantedBy=multi-user.target
 """
-                    tmp_service = "/tmp/auto-turbo.service"
-                    with open(tmp_service, "w") as f:
-                        f.write(service_content)
-
-                    # Install the dynamic service
-                    auth = self.get_auth_command()
-                    subprocess.run(
-                        auth
-                        + [
-                            "cp",
-                            tmp_service,
-                            "/etc/systemd/system/auto-turbo.service",
-                        ],
-                        capture_output=True,
-                    )
-                    subprocess.run(
-                        auth + ["systemctl", "daemon-reload"], capture_output=True
+                    # Skip pkexec/cp/Reload when the installed files already match
+                    if not self._file_matches(SERVICE_FILE, service_content):
+                        self._install_file(auth, service_content, SERVICE_FILE)
+                        self.systemd_call("Reload")
+
+                    # The daemon runs as root; tell it where our home (last_profile) is
+                    env_content = f"USER_HOME={os.path.expanduser('~')}\n"
+                    if not self._file_matches(ENV_FILE, env_content):
+                        self._install_file(auth, env_content, ENV_FILE)
+
+                    self.systemd_call("StartUnit", "(ss)", AUTO_TURBO_UNIT, "replace")
+                    # Also enable for boot persistence (runtime=False, force=True)
+                    self.systemd_call(
+                        "EnableUnitFiles", "(asbb)", [AUTO_TURBO_UNIT], False, True
                     )
-
-                subprocess.run(
-                    auth + ["systemctl", action, "auto-turbo"], capture_output=True
-                )
-                # Also enable/disable for boot persistence
-                boot_action = "enable" if active else "disable"
-                subprocess.run(
-                    auth + ["systemctl", boot_action, "auto-turbo"],
-                    capture_output=True,
-                )
+                else:
+                    self.systemd_call("StopUnit", "(ss)", AUTO_TURBO_UNIT, "replace")
+                    self.systemd_call("DisableUnitFiles", "(asb)", [AUTO_TURBO_UNIT], False)
 
                 GLib.idle_add(
                     self.status_label.set_text,
                     f"✓ Auto Turbo Service {'Enabled' if active else 'Disabled'}",
                 )
+            except InstallError as e:
+                GLib.idle_add(self.status_label.set_text, f"✗ Failed: {e}")
             except Exception as e:
                 GLib.idle_add(self.status_label.set_text, f"✗ Error: {str(e)}")
             finally:
@@ -458,6 +928,35 @@ WantedBy=multi-user.target
         thread.daemon = True
         thread.start()
 
+    def _install_file(self, auth, content, dest):
+        """Installs content as a root-owned 0644 file; raises InstallError."""
+        import tempfile
+
+        # Unpredictable name created O_EXCL and owned by us: nobody else can
+        # pre-create or swap the file root copies from
+        fd, tmp_path = tempfile.mkstemp(prefix="tdp-manager-")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(content)
+            self._run_install(auth + ["install", "-D", "-m", "644", tmp_path, dest])
+        finally:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    def _run_install(self, cmd):
+        """Runs a pkexec'd copy into /etc; raises InstallError if it failed."""
+        returncode, _, stderr = self._run(cmd, timeout=PRIVILEGED_TIMEOUT, capture=True)
+        if returncode == 0:
+            return
+        if returncode is None:
+            raise InstallError(stderr)  # "timed out after N seconds"
+        if returncode in (126, 127):
+            # pkexec: 126 = auth dismissed, 127 = not authorized
+            raise InstallError("authorization cancelled")
+        raise InstallError(stderr.strip() or f"exit code {returncode}")
+
     def on_fan_boost_toggled(self, switch, gparam):
         if self.is_applying:
             return
@@ -470,31 +969,17 @@ WantedBy=multi-user.target
                 f"{'Enabling' if active else 'Disabling'} Fan Boost..."
             )
 
-            def run_action():
-                # For now let's use a trick
-                auth = self.get_auth_command()
-                subprocess.run(
-                    auth
-                    + [
-                        "bash",
-                        "-c",
-                        f"echo {state} > /sys/devices/platform/acer-thermal-lite/fan_boost",
-                    ],
-                    capture_output=True,
-                )
-                GLib.idle_add(
-                    self.status_label.set_text,
-                    f"✓ Fan Boost {'Enabled' if active else 'Disabled'}",
-                )
-
-                def unlock():
-                    self.is_applying = False
-
-                GLib.idle_add(unlock)
+            def done(ok, error_msg):
+                if ok:
+                    self.status_label.set_text(
+                        f"✓ Fan Boost {'Enabled' if active else 'Disabled'}"
+                    )
+                else:
+                    self.status_label.set_text(f"✗ Failed: {error_msg}")
+                self.is_applying = False
+                return False
 
-            thread = threading.Thread(target=run_action)
-            thread.daemon = True
-            thread.start()
+            self.run_privileged(done, "fanboost", state)
 
     def on_gpu_clicked(self, button, limit):
         if self.is_applying:
@@ -503,56 +988,62 @@ WantedBy=multi-user.target
         self.is_applying = True
         self.status_label.set_text(f"Setting GPU limit to {limit}W...")
 
-        def run_action():
-            script_path = os.path.join(
-                os.path.dirname(os.path.abspath(__file__)), "tdp-manager.sh"
-            )
-            auth = self.get_auth_command()
-            subprocess.run(auth + [script_path, "gpu", str(limit)], capture_output=True)
-            GLib.idle_add(self.status_label.set_text, f"✓ GPU Limit set to {limit}W")
-
-            def unlock():
-                self.is_applying = False
-
-            GLib.idle_add(unlock)
+        def done(ok, error_msg):
+            if ok:
+                self.status_label.set_text(f"✓ GPU Limit set to {limit}W")
+            else:
+                self.status_label.set_text(f"✗ Failed: {error_msg}")
+            self.is_applying = False
+            return False
 
-        thread = threading.Thread(target=run_action)
-        thread.daemon = True
-        thread.start()
+        self.run_privileged(done, "gpu", str(limit))
 
     def read_gpu_temperature(self):
+        if self._gpu_handle is not None:
+            try:
+                return pynvml.nvmlDeviceGetTemperature(
+                    self._gpu_handle, pynvml.NVML_TEMPERATURE_GPU
+                )
+            except pynvml.NVMLError:
+                return 0
+
         try:
-            result = subprocess.run(
+            returncode, stdout, _ = self._run(
                 [
                     "nvidia-smi",
                     "--query-gpu=temperature.gpu",
                     "--format=csv,noheader,nounits",
                 ],
-                capture_output=True,
-                text=True,
                 timeout=1,
+                capture=True,
             )
-            if result.returncode == 0:
-                return int(result.stdout.strip())
+            if returncode == 0:
+                return int(stdout.strip())
         except Exception:
             pass
         return 0
 
     def read_gpu_limit(self):
+        if self._gpu_handle is not None:
+            try:
+                # NVML reports milliwatts
+                return pynvml.nvmlDeviceGetPowerManagementLimit(self._gpu_handle) // 1000
+            except pynvml.NVMLError:
+                return 0
+
         try:
-            result = subprocess.run(
+            returncode, stdout, _ = self._run(
                 [
                     "nvidia-smi",
                     "-q",
                     "-d",
                     "POWER",
                 ],
-                capture_output=True,
-                text=True,
                 timeout=1,
+                capture=True,
             )
-            if result.returncode == 0:
-                for line in result.stdout.splitlines():
+            if returncode == 0:
+                for line in stdout.splitlines():
                     if "Current Power Limit" in line:
                         return int(float(line.split(":")[1].strip().split()[0]))
         except Exception:
@@ -560,148 +1051,284 @@ WantedBy=multi-user.target
         return 0
 
     def read_fan_boost(self):
+        if self._fan_boost_fd is None:
+            if self._stop.is_set():
+                return False
+            # acer_thermal_lite may be loaded after the GUI started
+            self._fan_boost_fd = self._open_sysfs(FAN_BOOST_PATH)
+            if self._fan_boost_fd is None:
+                return False
         try:
-            path = "/sys/devices/platform/acer-thermal-lite/fan_boost"
-            if os.path.exists(path):
-                with open(path, "r") as f:
-                    return f.read().strip() == "1"
-        except Exception:
-            pass
-        return False
+            return os.pread(self._fan_boost_fd, 4, 0)[:1] == b"1"
+        except OSError:
+            # Module unloaded: the attribute is gone, reopen on a later tick
+            os.close(self._fan_boost_fd)
+            self._fan_boost_fd = None
+            return False
 
-    def read_temperature(self):
+    def read_platform_profile(self):
+        if self._profile_path is None:
+            # platform_profile may be registered after the GUI started
+            self._profile_path = self._find_platform_profile()
+            if self._profile_path is None:
+                return "unavailable"
+            GLib.idle_add(self._add_sysfs_monitor, self._profile_path)
         try:
-            # Try different thermal zone paths
-            for i in range(10):
-                path = f"/sys/class/thermal/thermal_zone{i}/temp"
-                if os.path.exists(path):
-                    try:
-                        type_path = f"/sys/class/thermal/thermal_zone{i}/type"
-                        with open(type_path, "r") as f:
-                            zone_type = f.read().strip()
-                        # Prefer CPU zones
-                        if "x86_pkg" in zone_type or "cpu" in zone_type.lower():
-                            with open(path, "r") as f:
-                                return int(f.read().strip()) // 1000
-                    except Exception:
-                        continue
-            # Fallback to zone 0
-            with open("/sys/class/thermal/thermal_zone0/temp", "r") as f:
-                return int(f.read().strip()) // 1000
-        except Exception:
-            return 0
-
-    def update_status(self):
-        if self.is_applying:
-            return True  # Don't update or trigger actions if busy
-
-        pl1 = self.read_rapl_value(0)
-        pl2 = self.read_rapl_value(1)
-        temp = self.read_temperature()
-        fan_boost = self.read_fan_boost()
-
-        self._updating_from_hw = True
-        self.fan_boost_switch.set_active(fan_boost)
-        self._updating_from_hw = False
+            with open(self._profile_path, "r") as f:
+                return f.read().strip()
+        except OSError:
+            # Driver unloaded: the watched path comes back with it
+            return "unavailable"
+
+    def _on_map(self, widget):
+        self._visible.set()
+
+    def _on_unmap(self, widget):
+        self._visible.clear()
+
+    def _on_window_state(self, widget, event):
+        hidden = Gdk.WindowState.ICONIFIED | Gdk.WindowState.WITHDRAWN
+        if event.new_window_state & hidden:
+            self._visible.clear()
+        else:
+            self._visible.set()
+        return False
 
-        # Read EC status
-        ec_status = "unavailable"
+    def _status_worker(self):
+        # On Linux nice() applies to the calling thread only: keep the
+        # poller (and the nvidia-smi children it spawns) behind the GTK thread
         try:
-            paths = glob.glob("/sys/class/platform-profile/*/profile")
-            if paths:
-                with open(paths[0], "r") as f:
-                    ec_status = f.read().strip()
-        except Exception:
+            os.nice(10)
+        except OSError:
             pass
+        while not self._stop.is_set():
+            self._visible.wait()
+            if self._stop.is_set():
+                break
+            snap = self._read_snapshot()
+            # Every read counts towards drift, including unchanged ones
+            profile_id = self._keep_profile
+            if profile_id is not None:
+                self._track_drift(profile_id, snap.pl1, snap.pl2)
+            # Nothing changed since the last tick: skip the UI update entirely
+            if snap != self._last_snapshot:
+                self._last_snapshot = snap
+                GLib.idle_add(self._apply_snapshot, snap)
+            self._wait_for_change(TEMP_POLL_INTERVAL)
+
+    def _read_snapshot(self):
+        """Reads hardware state (runs on the status thread, no GTK calls)."""
+        pl1, pl2, temp = self.read_sysfs()
+        fan_boost = self.read_fan_boost()
+        ec_status = self.read_platform_profile()
+
+        now = time.monotonic()
+        if self._gpu_handle is not None or now >= self._next_gpu_read:
+            self._gpu_status = (self.read_gpu_temperature(), self.read_gpu_limit())
+            self._next_gpu_read = now + GPU_POLL_INTERVAL
+        gpu_temp, gpu_limit = self._gpu_status
+        return Snapshot(pl1, pl2, temp, fan_boost, ec_status, gpu_temp, gpu_limit)
+
+    @staticmethod
+    def _set_text(label, text):
+        if label.get_text() != text:
+            label.set_text(text)
+
+    # Style-class changes trigger CSS re-matching: callers only invoke these
+    # when the computed state actually changed
+    @staticmethod
+    def _swap_class(widget, old_class, new_class):
+        ctx = widget.get_style_context()
+        if old_class:
+            ctx.remove_class(old_class)
+        ctx.add_class(new_class)
+
+    @staticmethod
+    def _move_class(css_class, old_widget, new_widget):
+        if old_widget is not None:
+            old_widget.get_style_context().remove_class(css_class)
+        if new_widget is not None:
+            new_widget.get_style_context().add_class(css_class)
+
+    def _apply_snapshot(self, snap):
+        """Updates widgets from a Snapshot (runs on the main thread)."""
+        if self.is_applying:
+            # Don't update or trigger actions if busy; resend on the next tick
+            self._last_snapshot = None
+            return False
 
-        self.ec_label.set_text(f"Acer EC: {ec_status}")
-        if ec_status == "unavailable":
-            self.ec_label.set_markup(
-                "<span color='#ffaa00'>Acer EC: unavailable (thermal module missing)</span>"
-            )
-
-        self.pl1_value.set_text(str(pl1))
+        pl1, pl2, temp = snap.pl1, snap.pl2, snap.cpu_temp
+        gpu_temp, gpu_limit = snap.gpu_temp, snap.gpu_limit
+        fan_boost, ec_status = snap.fan_boost, snap.ec_status
 
-        self.pl2_value.set_text(str(pl2))
+        if fan_boost != self.fan_boost_switch.get_active():
+            self._updating_from_hw = True
+            self.fan_boost_switch.set_active(fan_boost)
+            self._updating_from_hw = False
 
-        gpu_temp = self.read_gpu_temperature()
-        gpu_limit = self.read_gpu_limit()
-        self.temp_value.set_text(f"{temp} / {gpu_temp}")
+        # Markup is reparsed on every call: only touch the label on change
+        if ec_status != self._last_ec_status:
+            if ec_status == "unavailable":
+                self.ec_label.set_markup(
+                    "<span color='#ffaa00'>Acer EC: unavailable (thermal module missing)</span>"
+                )
+            else:
+                self.ec_label.set_text(f"Acer EC: {ec_status}")
+            self._last_ec_status = ec_status
+
+        # set_text queues a resize/redraw even for identical strings
+        self._set_text(self.pl1_value, str(pl1))
+        self._set_text(self.pl2_value, str(pl2))
+        self._set_text(self.temp_value, f"{temp} / {gpu_temp}")
         max_temp = max(temp, gpu_temp)
 
-        # Update temperature color
-        ctx = self.temp_value.get_style_context()
-        ctx.remove_class("temp-ok")
-        ctx.remove_class("temp-warn")
-        ctx.remove_class("temp-crit")
-
+        # Update temperature color (only when the range changes)
         if max_temp < 70:
-            ctx.add_class("temp-ok")
+            temp_class = "temp-ok"
         elif max_temp < 85:
-            ctx.add_class("temp-warn")
+            temp_class = "temp-warn"
         else:
-            ctx.add_class("temp-crit")
+            temp_class = "temp-crit"
+
+        if temp_class != self._last_temp_class:
+            self._swap_class(self.temp_value, self._last_temp_class, temp_class)
+            self._last_temp_class = temp_class
 
         # Update sliders to match current values
-        if not self.pl1_slider.has_focus():
-            self.pl1_slider.set_value(pl1)
-        if not self.pl2_slider.has_focus():
-            self.pl2_slider.set_value(pl2)
+        self._sync_slider(
+            self.pl1_slider, self._pl1_handler, self.pl1_slider_value, PL1_LABELS, pl1
+        )
+        self._sync_slider(
+            self.pl2_slider, self._pl2_handler, self.pl2_slider_value, PL2_LABELS, pl2
+        )
 
         # Highlight active profile
-        self.active_profile = None
-        for profile_id, btn in self.profile_buttons.items():
-            if profile_id in PROFILES:
-                _, profile_pl1, profile_pl2, profile_gpu = PROFILES[profile_id]
-                ctx = btn.get_style_context()
-
-                # GPU limit fluctuates due to Dynamic Boost (e.g. 80W base can show as 95W)
-                # We use a larger tolerance (20W) to keep the profile highlighted
-                gpu_match = abs(gpu_limit - profile_gpu) <= 20
-
-                if pl1 == profile_pl1 and pl2 == profile_pl2 and gpu_match:
-                    ctx.add_class("active")
-                    self.active_profile = profile_id
-                else:
-                    ctx.remove_class("active")
-
-        # Update GPU selection buttons highlighting
-        ctx_80 = self.gpu_80_btn.get_style_context()
-        ctx_115 = self.gpu_115_btn.get_style_context()
-        ctx_80.remove_class("active")
-        ctx_115.remove_class("active")
-
-        # Range-based highlighting for GPU targets
+        active, active_btn = None, None
+        row = self._profile_rows.get((pl1, pl2))
+        # GPU limit fluctuates due to Dynamic Boost (e.g. 80W base can show as 95W)
+        # We use a larger tolerance (20W) to keep the profile highlighted
+        if row and abs(gpu_limit - row[2]) <= 20:
+            active, active_btn, _ = row
+
+        if active != self.active_profile:
+            self._move_class("active", self._active_profile_btn, active_btn)
+            self.active_profile = active
+            self._active_profile_btn = active_btn
+
+        # Range-based highlighting for GPU targets (only on transitions)
         if gpu_limit <= 100:  # 80W base + Dynamic Boost
-            ctx_80.add_class("active")
+            gpu_btn = self.gpu_80_btn
         elif gpu_limit >= 110:  # 115W base
-            ctx_115.add_class("active")
+            gpu_btn = self.gpu_115_btn
+        else:
+            gpu_btn = None
+
+        if gpu_btn is not self._active_gpu_btn:
+            self._move_class("active", self._active_gpu_btn, gpu_btn)
+            self._active_gpu_btn = gpu_btn
+
+        return False  # One-shot idle callback
+
+    def _track_drift(self, profile_id, pl1, pl2):
+        """Counts reads off the held profile (runs on the status thread)."""
+        _, target_pl1, target_pl2, _ = PROFILES[profile_id]
+        if abs(pl1 - target_pl1) <= KEEP_BAND_W and abs(pl2 - target_pl2) <= KEEP_BAND_W:
+            self._drift_ticks = 0
+            if self._reapplies:
+                GLib.idle_add(self._keep_holding, profile_id)
+            return
+
+        self._drift_ticks += 1
+        if self._drift_ticks >= KEEP_DRIFT_TICKS:
+            self._drift_ticks = 0
+            GLib.idle_add(self._reapply_kept, profile_id)
+
+    def _keep_holding(self, profile_id):
+        if profile_id == self._keep_profile:
+            self._reapplies = 0  # Limits hold (again)
+        return False
+
+    def _reapply_kept(self, profile_id):
+        """Re-applies the held profile after drift (runs on the main loop)."""
+        # Released, replaced, or a re-apply is still in flight meanwhile
+        if profile_id != self._keep_profile or self.is_applying:
+            return False
+        _, target_pl1, target_pl2, _ = PROFILES[profile_id]
+
+        if self._reapplies >= KEEP_MAX_REAPPLIES:
+            self._stop_keeping("limits keep drifting back")
+            return False
+        # Never prompt from here: only an already authorized helper re-applies
+        if not self.helper_running():
+            self._stop_keeping("privileged helper not running")
+            return False
 
-        # Persistent Mode Logic (Anti-Throttle)
-        if self.keep_applied_switch.get_active() and self.active_profile:
-            _, target_pl1, target_pl2, target_gpu = PROFILES[self.active_profile]
-            # Precise check for CPU, tolerant check for GPU
-            gpu_diff = abs(gpu_limit - target_gpu) > 10
-            if pl1 != target_pl1 or pl2 != target_pl2 or gpu_diff:
-                # Re-apply only if significant drop or CPU change
-                # We use apply_power_limits to avoid double platform-profile hit
-                if pl1 != target_pl1 or pl2 != target_pl2:
-                    self.apply_power_limits(target_pl1, target_pl2)
+        self._reapplies += 1
+        self.is_applying = True
+
+        def worker():
+            ok, _ = self.run_helper_command(
+                "set", str(target_pl1), str(target_pl2), spawn=False
+            )
+            GLib.idle_add(done, ok)
+
+        def done(ok):
+            self.is_applying = False
+            if not ok:
+                self._stop_keeping("re-apply failed")
+            return False
+
+        thread = threading.Thread(target=worker)
+        thread.daemon = True
+        thread.start()
+        return False
 
-        return True  # Continue timer
+    def on_keep_applied_toggled(self, switch, gparam):
+        # Turning it back on doesn't resume: the next applied profile is held
+        if not switch.get_active():
+            self._keep_profile = None
+
+    def _stop_keeping(self, reason):
+        self._keep_profile = None
+        self._drift_ticks = 0
+        self._reapplies = 0
+        self.status_label.set_text(f"Keep Applied paused: {reason}")
+
+    @staticmethod
+    def _sync_slider(slider, handler_id, label, labels, value):
+        # Leave sliders the user is working with alone, and skip equal values
+        if slider.has_focus() or int(slider.get_value()) == value:
+            return
+        # Programmatic update: no value-changed dispatch, set the label directly
+        with slider.handler_block(handler_id):
+            slider.set_value(value)
+        label.set_text(labels[int(slider.get_value())])
 
+    # Dragging a slider emits value-changed per pixel; refresh the label at
+    # most once per frame (~60 Hz) with the latest value
     def on_pl1_changed(self, slider):
-        value = int(slider.get_value())
-        self.pl1_slider_value.set_text(f"{value}W")
+        if self._pl1_pending is None:
+            self._pl1_pending = GLib.timeout_add(16, self._flush_pl1_label)
 
     def on_pl2_changed(self, slider):
-        value = int(slider.get_value())
-        self.pl2_slider_value.set_text(f"{value}W")
+        if self._pl2_pending is None:
+            self._pl2_pending = GLib.timeout_add(16, self._flush_pl2_label)
+
+    def _flush_pl1_label(self):
+        self._pl1_pending = None
+        self.pl1_slider_value.set_text(PL1_LABELS[int(self.pl1_slider.get_value())])
+        return False
+
+    def _flush_pl2_label(self):
+        self._pl2_pending = None
+        self.pl2_slider_value.set_text(PL2_LABELS[int(self.pl2_slider.get_value())])
+        return False
 
     def on_profile_clicked(self, button, profile_id):
         self.apply_named_profile(profile_id)
 
     def on_apply_clicked(self, button):
+        self._keep_profile = None  # Custom limits: nothing to hold
         pl1 = int(self.pl1_slider.get_value())
         pl2 = int(self.pl2_slider.get_value())
         self.apply_power_limits(pl1, pl2)
@@ -710,6 +1337,10 @@ WantedBy=multi-user.target
         if self.is_applying:
             return
         self.is_applying = True
+        # Only a profile applied with Keep Applied on is held
+        self._keep_profile = profile_id if self.keep_applied_switch.get_active() else None
+        self._drift_ticks = 0
+        self._reapplies = 0
         self.status_label.set_text(f"Applying profile: {profile_id}...")
 
         # Save desired profile for the background daemon and persistence
@@ -723,51 +1354,22 @@ WantedBy=multi-user.target
 
             # Save persistence for next boot
             config_dir = os.path.expanduser("~/.config/tdp-manager")
-            if not os.path.exists(config_dir):
-                os.makedirs(config_dir, exist_ok=True)
+            os.makedirs(config_dir, exist_ok=True)
 
             with open(os.path.join(config_dir, "last_profile"), "w") as f:
                 f.write(profile_id)
         except Exception as e:
             print(f"Warning: Could not save profile persistence: {e}")
 
-        def apply():
-            script_path = os.path.join(
-                os.path.dirname(os.path.abspath(__file__)), "tdp-manager.sh"
-            )
-
-            try:
-                auth = self.get_auth_command()
-                result = subprocess.run(
-                    auth + [script_path, "profile", profile_id],
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
-                )
-
-                if result.returncode == 0:
-                    GLib.idle_add(
-                        self.status_label.set_text, f"✓ Applied Profile: {profile_id}"
-                    )
-                else:
-                    error_msg = (
-                        result.stderr.strip()
-                        if result.stderr
-                        else "Auth cancelled or error"
-                    )
-                    GLib.idle_add(self.status_label.set_text, f"✗ Failed: {error_msg}")
-            except Exception as e:
-                GLib.idle_add(self.status_label.set_text, f"✗ Error: {str(e)}")
-            finally:
-
-                def unlock():
-                    self.is_applying = False
-
-                GLib.idle_add(unlock)
+        def done(ok, error_msg):
+            if ok:
+                self.status_label.set_text(f"✓ Applied Profile: {profile_id}")
+            else:
+                self.status_label.set_text(f"✗ Failed: {error_msg}")
+            self.is_applying = False
+            return False
 
-        thread = threading.Thread(target=apply)
-        thread.daemon = True
-        thread.start()
+        self.run_privileged(done, "profile", profile_id)
 
     def apply_power_limits(self, pl1, pl2):
         if self.is_applying:
@@ -775,44 +1377,15 @@ WantedBy=multi-user.target
         self.is_applying = True
         self.status_label.set_text("Applying custom limits...")
 
-        def apply():
-            script_path = os.path.join(
-                os.path.dirname(os.path.abspath(__file__)), "tdp-manager.sh"
-            )
-
-            try:
-                auth = self.get_auth_command()
-                result = subprocess.run(
-                    auth + [script_path, "set", str(pl1), str(pl2)],
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
-                )
-
-                if result.returncode == 0:
-                    GLib.idle_add(
-                        self.status_label.set_text,
-                        f"✓ Applied Limits: PL1={pl1}W PL2={pl2}W",
-                    )
-                else:
-                    error_msg = (
-                        result.stderr.strip()
-                        if result.stderr
-                        else "Auth cancelled or error"
-                    )
-                    GLib.idle_add(self.status_label.set_text, f"✗ Failed: {error_msg}")
-            except Exception as e:
-                GLib.idle_add(self.status_label.set_text, f"✗ Error: {str(e)}")
-            finally:
-
-                def unlock():
-                    self.is_applying = False
-
-                GLib.idle_add(unlock)
+        def done(ok, error_msg):
+            if ok:
+                self.status_label.set_text(f"✓ Applied Limits: PL1={pl1}W PL2={pl2}W")
+            else:
+                self.status_label.set_text(f"✗ Failed: {error_msg}")
+            self.is_applying = False
+            return False
 
-        thread = threading.Thread(target=apply)
-        thread.daemon = True
-        thread.start()
+        self.run_privileged(done, "set", str(pl1), str(pl2))
 
 
 def main():
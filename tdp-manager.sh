@@ -396,6 +396,57 @@ apply_profile() {
     echo -e "${GREEN}✓ Profile ${profile} applied!${NC}"
 }
 
+# Auto Turbo: force EC into performance (max fans) but keep the current limits
+# Used by auto-turbo-daemon.py so turbo entry costs a single script invocation
+apply_turbo() {
+    local pl1=$1
+    local pl2=$2
+    local gpu_limit=${3:-0}
+
+    # 1. Force EC into Turbo (Performance) mode - This will ramp up fans
+    set_platform_profile performance
+    # 2. Wait a bit for EC to stabilize
+    sleep 0.5
+    # 3. Restore the user power limits (hardware override bypass)
+    set_power_limits "$pl1" "$pl2"
+    # 4. Restore GPU limit if the caller could read it (0 = unknown)
+    if [[ "$gpu_limit" =~ ^[0-9]+$ ]] && [[ $gpu_limit -gt 0 ]]; then
+        set_gpu_limit "$gpu_limit"
+    fi
+}
+
+# Command server: reads one command per line from stdin and answers "OK" or
+# "ERR <code>" on stdout. Long-running callers (auto-turbo-daemon.py) keep a
+# single instance open instead of starting the script for every action.
+# Command output goes to stderr; stdin of each command is /dev/null so the
+# safety prompt in set_power_limits can never swallow the next command.
+run_server() {
+    local cmd arg1 arg2 arg3 rc msg out
+    # Command output goes to a scratch file so a failure can be reported back
+    out=$(mktemp) || return 1
+    trap 'rm -f "$out"' EXIT
+    while read -r cmd arg1 arg2 arg3; do
+        [[ -z "$cmd" ]] && continue
+        case "$cmd" in
+            profile)     apply_profile "$arg1" ;;
+            set)         set_power_limits "$arg1" "$arg2" ;;
+            gpu)         set_gpu_limit "$arg1" ;;
+            fanboost)    set_fan_boost "$arg1" ;;
+            platform)    set_platform_profile "$arg1" ;;
+            turbo-apply) apply_turbo "$arg1" "$arg2" "$arg3" ;;
+            *)           echo "Unknown server command: $cmd"; false ;;
+        esac < /dev/null > "$out" 2>&1
+        rc=$?
+        if [[ $rc -eq 0 ]]; then
+            echo "OK"
+        else
+            # Last non-empty output line, colors stripped: "ERR <rc> <message>"
+            msg=$(sed -e 's/\x1b\[[0-9;]*m//g' -e '/^[[:space:]]*$/d' "$out" | tail -n 1)
+            echo "ERR $rc $msg"
+        fi
+    done
+}
+
 # Show current status
 show_status() {
     echo -e "${CYAN}╔══════════════════════════════════════════════════════════════╗${NC}"
@@ -615,6 +666,10 @@ Commands:
 
 
   profile <name>      Apply a power profile (TDP + governor + EPP)
+  turbo-apply <PL1> <PL2> [GPU]
+                      EC performance mode (max fans) keeping the given limits
+  server              Read commands (profile/set/gpu/fanboost/platform/
+                      turbo-apply) from stdin, answer OK/ERR per line
 
   governor <mode>     Set CPU governor (performance|powersave)
   epp <mode>          Set Energy Performance Preference
@@ -836,6 +891,14 @@ main() {
             check_root "$1"
             apply_profile "$2"
             ;;
+        turbo-apply)
+            check_root "$1"
+            apply_turbo "$2" "$3" "$4"
+            ;;
+        server)
+            check_root "$1"
+            run_server
+            ;;
         governor)
             check_root "$1"
             set_governor "$2"